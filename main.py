@@ -1,52 +1,257 @@
+import asyncio
+import logging
+import os
 import sqlite3
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from contextlib import asynccontextmanager, contextmanager
+from fastapi import FastAPI, HTTPException, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
+from pydantic import BaseModel, ConfigDict
+from redis import asyncio as aioredis
+from sql import SQL, prewarm_statements
+
+logger = logging.getLogger(__name__)
 
 # Database setup
+# The database runs in WAL mode, so SQLite keeps polls.db-wal and polls.db-shm
+# files next to polls.db while it is open.
 DATABASE_URL = "polls.db"
 
-# Create tables if they don't exist
+# Response cache for the list endpoints; entries are dropped on every write
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
+LIST_CACHE_EXPIRE = 30
+
+# Most single-row creates committed together by one insert batcher flush
+WRITE_BATCH_MAX = 500
+
+# Per-connection settings; journal_mode=WAL is persisted in the database file
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+def configure_db(conn):
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+
+# Run several statements as one write transaction.
+# Callers using the shared connection must hold app.state.write_lock.
+@contextmanager
+def write_transaction(conn):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+# Bump when create_schema changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 1
+
+# Tables and indexes, created if they don't exist
+def create_schema(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS polls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            question TEXT NOT NULL,
+            likes INTEGER DEFAULT 0
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS comments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            poll_id INTEGER,
+            content TEXT,
+            FOREIGN KEY (poll_id) REFERENCES polls (id)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS teams (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            team_name TEXT NOT NULL,
+            city TEXT NOT NULL,
+            championships INTEGER DEFAULT 0
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS players (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            jersey_number INTEGER NOT NULL,
+            position TEXT NOT NULL,
+            team_id INTEGER,
+            FOREIGN KEY (team_id) REFERENCES teams (id)
+        )
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_comments_poll_id ON comments (poll_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_players_team_id ON players (team_id)")
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+# Create the schema unless user_version says it is current. Only the first
+# worker to find it outdated runs the DDL; the others skip it, or wait on
+# BEGIN IMMEDIATE and then see the bumped version.
 def init_db():
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS polls (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                question TEXT NOT NULL,
-                likes INTEGER DEFAULT 0
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS comments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                poll_id INTEGER,
-                content TEXT,
-                FOREIGN KEY (poll_id) REFERENCES polls (id)
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS teams (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                team_name TEXT NOT NULL,
-                city TEXT NOT NULL,
-                championships INTEGER DEFAULT 0
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS players (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                jersey_number INTEGER NOT NULL,
-                position TEXT NOT NULL,
-                team_id INTEGER,
-                FOREIGN KEY (team_id) REFERENCES teams (id)
-            )
-        ''')
-        conn.commit()
+    conn = sqlite3.connect(DATABASE_URL, isolation_level=None)
+    try:
+        configure_db(conn)
+        if schema_version(conn) >= SCHEMA_VERSION:
+            return
+        with write_transaction(conn):
+            if schema_version(conn) < SCHEMA_VERSION:
+                create_schema(conn.cursor())
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    finally:
+        conn.close()
 
 init_db()
 
-app = FastAPI()
+# Drop cached list responses after a write. Best effort: the write is already
+# committed, so a cache outage is logged rather than turned into an error.
+async def clear_cache(namespace):
+    try:
+        await FastAPICache.clear(namespace=namespace)
+    except Exception:
+        logger.exception("Failed to clear cache namespace %s", namespace)
+
+# Blocking query helpers, run off the event loop with asyncio.to_thread
+def fetch_all(conn, sql, keys, params=()):
+    return [dict(zip(keys, row)) for row in conn.execute(sql, params)]
+
+def fetch_one(conn, sql, params=()):
+    return conn.execute(sql, params).fetchone()
+
+# Insert all rows in one transaction and return their RETURNING rows.
+# executemany() cannot return rows, so each insert runs the cached statement.
+def insert_many(conn, sql, rows):
+    with write_transaction(conn):
+        return [conn.execute(sql, row).fetchone() for row in rows]
+
+# Only tables listed in SQL.EXISTS can be probed
+def row_exists(conn, table, pk):
+    return conn.execute(SQL.EXISTS[table], (pk,)).fetchone() is not None
+
+# Name of the first foreign key column whose referenced row is missing, if any
+def missing_parent(conn, parents, items):
+    for col, table in parents.items():
+        for pk in {getattr(item, col) for item in items}:
+            if pk is not None and not row_exists(conn, table, pk):
+                return col
+    return None
+
+# Insert every queued item in one transaction. Each item gets back its
+# RETURNING row, or the exception it raised; an HTTPException if a referenced
+# parent row is missing. Items run under their own savepoint so one failing
+# insert is undone on its own instead of rolling back the whole batch.
+def insert_batch(conn, sql, parents, items):
+    results = []
+    with write_transaction(conn):
+        for item in items:
+            conn.execute("SAVEPOINT batch_item")
+            try:
+                col = missing_parent(conn, parents, [item])
+                if col is not None:
+                    results.append(HTTPException(status_code=400, detail=f"Invalid {col}"))
+                else:
+                    results.append(conn.execute(sql, tuple(item.__dict__.values())).fetchone())
+            except (sqlite3.Error, OverflowError) as exc:
+                conn.execute("ROLLBACK TO batch_item")
+                results.append(exc)
+            conn.execute("RELEASE batch_item")
+    return results
+
+# Queues single-row creates so that concurrent POSTs share one commit. A
+# background task drains whatever has queued up (at most WRITE_BATCH_MAX items)
+# and inserts it in one transaction. Batchers are created in lifespan so the
+# queue and task belong to the running event loop.
+class InsertBatcher:
+    def __init__(self, statements, parents, conn, write_lock):
+        self.statements = statements
+        self.parents = parents
+        self.conn = conn
+        self.write_lock = write_lock
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self.run())
+
+    async def submit(self, item):
+        if self.task.done():
+            raise RuntimeError("Insert batcher is not running")
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((item, future))
+        return await future
+
+    async def run(self):
+        batch = []
+        try:
+            while True:
+                batch = [await self.queue.get()]
+                while len(batch) < WRITE_BATCH_MAX and not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                items = [item for item, _ in batch]
+                try:
+                    async with self.write_lock:
+                        results = await asyncio.to_thread(insert_batch, self.conn, self.statements.create,
+                                                          self.parents, items)
+                except Exception as exc:
+                    results = [exc] * len(batch)
+                for (_, future), result in zip(batch, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                batch = []
+        finally:
+            # Fail anything still waiting so no request hangs on a dead flusher
+            while not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Insert batcher stopped"))
+
+    async def stop(self):
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+# (name, statements, parents) for each resource whose creates are batched;
+# lifespan builds an InsertBatcher for each one
+batched_resources = []
+
+# Open one long-lived write connection and one read-only connection per
+# process and reuse them for every request
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    conn = sqlite3.connect(DATABASE_URL, check_same_thread=False, isolation_level=None,
+                           cached_statements=256)
+    configure_db(conn)
+    app.state.db = conn
+    read_conn = sqlite3.connect(f"file:{DATABASE_URL}?mode=ro", uri=True, check_same_thread=False,
+                                isolation_level=None, cached_statements=256)
+    configure_db(read_conn)
+    prewarm_statements(read_conn)
+    app.state.db_read = read_conn
+    # Writes go through the write connection one at a time. Handlers hold this
+    # lock while their statement runs in a worker thread. Reads use the
+    # read-only connection, so under WAL they only ever see committed data.
+    app.state.write_lock = asyncio.Lock()
+    app.state.batchers = {name: InsertBatcher(statements, parents, conn, app.state.write_lock)
+                          for name, statements, parents in batched_resources}
+    FastAPICache.init(RedisBackend(aioredis.from_url(REDIS_URL)), prefix="itmajor3-cache")
+    yield
+    for batcher in app.state.batchers.values():
+        await batcher.stop()
+    read_conn.close()
+    conn.close()
+
+app = FastAPI(lifespan=lifespan)
 
 # Pydantic Models
 class PollCreate(BaseModel):
@@ -55,6 +260,13 @@ class PollCreate(BaseModel):
 class PollUpdate(BaseModel):
     question: str = None
 
+class PollRead(BaseModel):
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
+
+    id: int
+    question: str
+    likes: int | None
+
 class CommentCreate(BaseModel):
     poll_id: int
     content: str
@@ -62,6 +274,13 @@ class CommentCreate(BaseModel):
 class CommentUpdate(BaseModel):
     content: str = None
 
+class CommentRead(BaseModel):
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
+
+    id: int
+    poll_id: int | None
+    content: str | None
+
 class TeamCreate(BaseModel):
     team_name: str
     city: str
@@ -72,6 +291,14 @@ class TeamUpdate(BaseModel):
     city: str = None
     championships: int = None
 
+class TeamRead(BaseModel):
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
+
+    id: int
+    team_name: str
+    city: str
+    championships: int | None
+
 class PlayerCreate(BaseModel):
     name: str
     jersey_number: int
@@ -84,215 +311,114 @@ class PlayerUpdate(BaseModel):
     position: str = None
     team_id: int = None
 
-# Poll Routes
-@app.post("/polls/", response_model=PollCreate)
-def create_poll(poll: PollCreate):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO polls (question) VALUES (?)", (poll.question,))
-        conn.commit()
-        return poll
-
-@app.get("/polls/")
-def get_polls():
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM polls")
-        polls = cursor.fetchall()
-        return [{"id": row[0], "question": row[1], "likes": row[2]} for row in polls]
-
-@app.get("/polls/{poll_id}")
-def get_poll(poll_id: int):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM polls WHERE id = ?", (poll_id,))
-        poll = cursor.fetchone()
-        if poll is None:
-            raise HTTPException(status_code=404, detail="Poll not found")
-        return {"id": poll[0], "question": poll[1], "likes": poll[2]}
-
-@app.put("/polls/{poll_id}", response_model=PollUpdate)
-def update_poll(poll_id: int, poll_update: PollUpdate):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        existing_poll = cursor.execute("SELECT * FROM polls WHERE id = ?", (poll_id,)).fetchone()
-        if existing_poll is None:
-            raise HTTPException(status_code=404, detail="Poll not found")
-        
-        updated_question = poll_update.question if poll_update.question is not None else existing_poll[1]
-
-        cursor.execute("UPDATE polls SET question = ? WHERE id = ?", (updated_question, poll_id))
-        conn.commit()
-        return {"id": poll_id, "question": updated_question, "likes": existing_poll[2]}
-
-@app.delete("/polls/{poll_id}")
-def delete_poll(poll_id: int):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM polls WHERE id = ?", (poll_id,))
-        conn.commit()
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Poll not found")
-        return {"detail": "Poll deleted successfully"}
-
-# Comment Routes
-@app.post("/comments/", response_model=CommentCreate)
-def create_comment(comment: CommentCreate):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO comments (poll_id, content) VALUES (?, ?)", (comment.poll_id, comment.content))
-        conn.commit()
-        return comment
-
-@app.get("/comments/")
-def get_comments():
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM comments")
-        comments = cursor.fetchall()
-        return [{"id": row[0], "poll_id": row[1], "content": row[2]} for row in comments]
-
-@app.get("/comments/{comment_id}")
-def get_comment(comment_id: int):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM comments WHERE id = ?", (comment_id,))
-        comment = cursor.fetchone()
-        if comment is None:
-            raise HTTPException(status_code=404, detail="Comment not found")
-        return {"id": comment[0], "poll_id": comment[1], "content": comment[2]}
-
-@app.put("/comments/{comment_id}", response_model=CommentUpdate)
-def update_comment(comment_id: int, comment_update: CommentUpdate):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        existing_comment = cursor.execute("SELECT * FROM comments WHERE id = ?", (comment_id,)).fetchone()
-        if existing_comment is None:
-            raise HTTPException(status_code=404, detail="Comment not found")
-        
-        updated_content = comment_update.content if comment_update.content is not None else existing_comment[2]
-
-        cursor.execute("UPDATE comments SET content = ? WHERE id = ?", (updated_content, comment_id))
-        conn.commit()
-        return {"id": comment_id, "poll_id": existing_comment[1], "content": updated_content}
-
-@app.delete("/comments/{comment_id}")
-def delete_comment(comment_id: int):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM comments WHERE id = ?", (comment_id,))
-        conn.commit()
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Comment not found")
-        return {"detail": "Comment deleted successfully"}
-
-# Team Routes
-@app.post("/teams/", response_model=TeamCreate)
-def create_team(team: TeamCreate):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO teams (team_name, city, championships) VALUES (?, ?, ?)", 
-                       (team.team_name, team.city, team.championships))
-        conn.commit()
-        return team
-
-@app.get("/teams/")
-def get_teams():
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM teams")
-        teams = cursor.fetchall()
-        return [{"id": row[0], "team_name": row[1], "city": row[2], "championships": row[3]} for row in teams]
-
-@app.get("/teams/{team_id}")
-def get_team(team_id: int):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM teams WHERE id = ?", (team_id,))
-        team = cursor.fetchone()
-        if team is None:
-            raise HTTPException(status_code=404, detail="Team not found")
-        return {"id": team[0], "team_name": team[1], "city": team[2], "championships": team[3]}
-
-@app.put("/teams/{team_id}", response_model=TeamUpdate)
-def update_team(team_id: int, team_update: TeamUpdate):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        existing_team = cursor.execute("SELECT * FROM teams WHERE id = ?", (team_id,)).fetchone()
-        if existing_team is None:
-            raise HTTPException(status_code=404, detail="Team not found")
-        
-        updated_team_name = team_update.team_name if team_update.team_name is not None else existing_team[1]
-        updated_city = team_update.city if team_update.city is not None else existing_team[2]
-        updated_championships = team_update.championships if team_update.championships is not None else existing_team[3]
-
-        cursor.execute("UPDATE teams SET team_name = ?, city = ?, championships = ? WHERE id = ?",
-                       (updated_team_name, updated_city, updated_championships, team_id))
-        conn.commit()
-        return {"id": team_id, "team_name": updated_team_name, "city": updated_city, "championships": updated_championships}
-
-@app.delete("/teams/{team_id}")
-def delete_team(team_id: int):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM teams WHERE id = ?", (team_id,))
-        conn.commit()
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Team not found")
-        return {"detail": "Team deleted successfully"}
-
-# Player Routes
-@app.post("/players/", response_model=PlayerCreate)
-def create_player(player: PlayerCreate):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO players (name, jersey_number, position, team_id) VALUES (?, ?, ?, ?)", 
-                       (player.name, player.jersey_number, player.position, player.team_id))
-        conn.commit()
-        return player
-
-@app.get("/players/")
-def get_players():
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM players")
-        players = cursor.fetchall()
-        return [{"id": row[0], "name": row[1], "jersey_number": row[2], "position": row[3], "team_id": row[4]} for row in players]
-
-@app.get("/players/{player_id}")
-def get_player(player_id: int):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM players WHERE id = ?", (player_id,))
-        player = cursor.fetchone()
-        if player is None:
-            raise HTTPException(status_code=404, detail="Player not found")
-        return {"id": player[0], "name": player[1], "jersey_number": player[2], "position": player[3], "team_id": player[4]}
-
-@app.put("/players/{player_id}", response_model=PlayerUpdate)
-def update_player(player_id: int, player_update: PlayerUpdate):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        existing_player = cursor.execute("SELECT * FROM players WHERE id = ?", (player_id,)).fetchone()
-        if existing_player is None:
-            raise HTTPException(status_code=404, detail="Player not found")
-        
-        updated_name = player_update.name if player_update.name is not None else existing_player[1]
-        updated_jersey_number = player_update.jersey_number if player_update.jersey_number is not None else existing_player[2]
-        updated_position = player_update.position if player_update.position is not None else existing_player[3]
-        updated_team_id = player_update.team_id if player_update.team_id is not None else existing_player[4]
-
-        cursor.execute("UPDATE players SET name = ?, jersey_number = ?, position = ?, team_id = ? WHERE id = ?",
-                       (updated_name, updated_jersey_number, updated_position, updated_team_id, player_id))
-        conn.commit()
-        return {"id": player_id, "name": updated_name, "jersey_number": updated_jersey_number, "position": updated_position, "team_id": updated_team_id}
-
-@app.delete("/players/{player_id}")
-def delete_player(player_id: int):
-    with sqlite3.connect(DATABASE_URL) as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM players WHERE id = ?", (player_id,))
-        conn.commit()
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Player not found")
-        return {"detail": "Player deleted successfully"}
+class PlayerRead(BaseModel):
+    model_config = ConfigDict(extra="forbid", from_attributes=True)
+
+    id: int
+    name: str
+    jersey_number: int
+    position: str
+    team_id: int | None
+
+# CRUD routes, generated once per resource
+def register_crud(app, name, label, statements, create_model, update_model, read_model,
+                  bulk=False, conflict_detail=None, parents=None):
+    singular = label.lower()
+    not_found = f"{label} not found"
+    keys = statements.keys
+    insert_cols = statements.insert_cols
+    update_cols = statements.update_cols
+    # Statement parameters are taken straight from the validated model's
+    # __dict__, so the model fields must be declared in column order
+    if tuple(create_model.model_fields) != insert_cols:
+        raise ValueError(f"{create_model.__name__} fields must match {insert_cols}")
+    if tuple(update_model.model_fields) != update_cols:
+        raise ValueError(f"{update_model.__name__} fields must match {update_cols}")
+    # Foreign key columns mapped to the table they reference
+    parents = parents or {}
+    update_parents = {col: table for col, table in parents.items() if col in update_cols}
+    batched_resources.append((name, statements, parents))
+
+    async def check_parents(conn, parents, items):
+        col = await asyncio.to_thread(missing_parent, conn, parents, items)
+        if col is not None:
+            raise HTTPException(status_code=400, detail=f"Invalid {col}")
+
+    async def create_item(item: create_model):
+        row = await app.state.batchers[name].submit(item)
+        await clear_cache(name)
+        return dict(zip(keys, row))
+
+    async def bulk_create_items(items: list[create_model]):
+        conn = app.state.db
+        rows = [tuple(item.__dict__.values()) for item in items]
+        async with app.state.write_lock:
+            await check_parents(conn, parents, items)
+            created = await asyncio.to_thread(insert_many, conn, statements.create, rows)
+        await clear_cache(name)
+        return [dict(zip(keys, row)) for row in created]
+
+    @cache(expire=LIST_CACHE_EXPIRE, namespace=name)
+    async def list_items():
+        conn = app.state.db_read
+        return await asyncio.to_thread(fetch_all, conn, statements.list, keys)
+
+    async def get_item(item_id: int):
+        conn = app.state.db_read
+        row = await asyncio.to_thread(fetch_one, conn, statements.get_json, (item_id,))
+        if row is None:
+            raise HTTPException(status_code=404, detail=not_found)
+        return Response(row[0], media_type="application/json")
+
+    async def update_item(item_id: int, item_update: update_model):
+        conn = app.state.db
+        values = tuple(item_update.__dict__.values())
+        sql = statements.update_all if all(v is not None for v in values) else statements.update
+        async with app.state.write_lock:
+            try:
+                await check_parents(conn, update_parents, [item_update])
+            except HTTPException:
+                # A missing target row takes precedence over a bad parent id
+                if not await asyncio.to_thread(row_exists, conn, name, item_id):
+                    raise HTTPException(status_code=404, detail=not_found)
+                raise
+            row = await asyncio.to_thread(fetch_one, conn, sql, (*values, item_id))
+        if row is None:
+            raise HTTPException(status_code=404, detail=not_found)
+        await clear_cache(name)
+        return dict(zip(keys, row))
+
+    async def delete_item(item_id: int):
+        conn = app.state.db
+        async with app.state.write_lock:
+            try:
+                row = await asyncio.to_thread(fetch_one, conn, statements.delete, (item_id,))
+            except sqlite3.IntegrityError:
+                raise HTTPException(status_code=409, detail=conflict_detail)
+        if row is None:
+            raise HTTPException(status_code=404, detail=not_found)
+        await clear_cache(name)
+        return {"detail": f"{label} deleted successfully"}
+
+    app.add_api_route(f"/{name}/", create_item, methods=["POST"], response_model=read_model,
+                      name=f"create_{singular}")
+    if bulk:
+        app.add_api_route(f"/{name}/bulk/", bulk_create_items, methods=["POST"],
+                          response_model=list[read_model], name=f"bulk_create_{name}")
+    app.add_api_route(f"/{name}/", list_items, methods=["GET"], response_model=list[read_model],
+                      name=f"get_{name}")
+    app.add_api_route(f"/{name}/{{item_id}}", get_item, methods=["GET"], response_model=read_model,
+                      name=f"get_{singular}")
+    app.add_api_route(f"/{name}/{{item_id}}", update_item, methods=["PUT"], response_model=read_model,
+                      name=f"update_{singular}")
+    app.add_api_route(f"/{name}/{{item_id}}", delete_item, methods=["DELETE"],
+                      name=f"delete_{singular}")
+
+register_crud(app, "polls", "Poll", SQL.POLLS, PollCreate, PollUpdate, PollRead,
+              conflict_detail="Poll still has comments")
+register_crud(app, "comments", "Comment", SQL.COMMENTS, CommentCreate, CommentUpdate, CommentRead,
+              bulk=True, parents={"poll_id": "polls"})
+register_crud(app, "teams", "Team", SQL.TEAMS, TeamCreate, TeamUpdate, TeamRead,
+              bulk=True, conflict_detail="Team still has players")
+register_crud(app, "players", "Player", SQL.PLAYERS, PlayerCreate, PlayerUpdate, PlayerRead,
+              bulk=True, parents={"team_id": "teams"})
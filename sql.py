@@ -0,0 +1,53 @@
+# CRUD statements for one table, built once at import so the same string
+# objects hit the connection's statement cache on every call
+class CrudSQL:
+    def __init__(self, table, keys, insert_cols, update_cols):
+        cols = ", ".join(keys)
+        # Columns returned by the read paths, also used as the response dict keys
+        self.keys = keys
+        self.insert_cols = insert_cols
+        self.update_cols = update_cols
+
+        self.insert = (f"INSERT INTO {table} ({', '.join(insert_cols)}) "
+                       f"VALUES ({', '.join('?' * len(insert_cols))})")
+        self.create = f"{self.insert} RETURNING {cols}"
+        self.list = f"SELECT {cols} FROM {table}"
+        # Single-row reads are encoded to JSON by SQLite itself
+        pairs = ", ".join(f"'{key}', {key}" for key in keys)
+        self.get_json = f"SELECT json_object({pairs}) FROM {table} WHERE id = ?"
+        # Partial update keeps unset columns; full update is used when every field is sent
+        self.update = (f"UPDATE {table} SET "
+                       + ", ".join(f"{col} = COALESCE(?, {col})" for col in update_cols)
+                       + f" WHERE id = ? RETURNING {cols}")
+        self.update_all = (f"UPDATE {table} SET "
+                           + ", ".join(f"{col} = ?" for col in update_cols)
+                           + f" WHERE id = ? RETURNING {cols}")
+        self.delete = f"DELETE FROM {table} WHERE id = ? RETURNING id"
+
+class SQL:
+    POLLS = CrudSQL("polls", ("id", "question", "likes"),
+                    insert_cols=("question",),
+                    update_cols=("question",))
+    COMMENTS = CrudSQL("comments", ("id", "poll_id", "content"),
+                       insert_cols=("poll_id", "content"),
+                       update_cols=("content",))
+    TEAMS = CrudSQL("teams", ("id", "team_name", "city", "championships"),
+                    insert_cols=("team_name", "city", "championships"),
+                    update_cols=("team_name", "city", "championships"))
+    PLAYERS = CrudSQL("players", ("id", "name", "jersey_number", "position", "team_id"),
+                      insert_cols=("name", "jersey_number", "position", "team_id"),
+                      update_cols=("name", "jersey_number", "position", "team_id"))
+
+    # Existence probes, one per table; also the whitelist of probeable tables
+    EXISTS = {table: f"SELECT 1 FROM {table} WHERE id = ? LIMIT 1"
+              for table in ("polls", "comments", "teams", "players")}
+
+    # Read statements compiled into the statement cache at startup
+    PREWARM = tuple(sql for table in (POLLS, COMMENTS, TEAMS, PLAYERS)
+                    for sql in (table.list, table.get_json))
+
+# Execute each prewarm statement once with NULL parameters. The exact SQL text
+# is used (no LIMIT suffix) so the cached entry is the one handlers look up.
+def prewarm_statements(conn):
+    for sql in SQL.PREWARM:
+        conn.execute(sql, (None,) * sql.count("?")).close()